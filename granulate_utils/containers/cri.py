@@ -16,6 +16,8 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -34,6 +36,8 @@ RUNTIMES = [
     "/run/containerd/containerd.sock",
     "/var/run/crio/crio.sock",
 ]
+# max ContainerStatus RPCs in flight at once when listing containers with all_info
+CONTAINER_STATUS_BATCH_SIZE = 32
 
 
 class _Client:
@@ -41,14 +45,29 @@ class _Client:
 
     def __init__(self, path: str) -> None:
         self.path = path
-        with self.stub() as stub:
-            version = stub.Version(self.api.api_pb2.VersionRequest())
+        # one long-lived channel (and stub) per runtime, instead of a new connection per request
+        self._channel = grpc.insecure_channel(path)
+        self._stub = self.api.api_pb2_grpc.RuntimeServiceStub(self._channel)
+        try:
+            with self.stub() as stub:
+                version = stub.Version(self.api.api_pb2.VersionRequest())
+        except BaseException:
+            self.close()
+            raise
         self.runtime_name = version.runtime_name
+        # request messages are never mutated, so build the listing requests once
+        api_pb2 = self.api.api_pb2
+        self._list_running_request = api_pb2.ListContainersRequest(
+            filter=api_pb2.ContainerFilter(state=api_pb2.ContainerStateValue(state=api_pb2.CONTAINER_RUNNING))
+        )
+        self._list_all_request = api_pb2.ListContainersRequest()
 
     @contextmanager
     def stub(self):
-        with grpc.insecure_channel(self.path) as channel:
-            yield self.api.api_pb2_grpc.RuntimeServiceStub(channel)
+        yield self._stub
+
+    def close(self) -> None:
+        self._channel.close()
 
     @staticmethod
     def _reconstruct_name(container) -> str:
@@ -65,24 +84,32 @@ class _Client:
         return "_".join(["k8s", container_name, sandbox_name, namespace, sandbox_uid, restart_count])
 
     def list_containers(self, all_info: bool, only_running: bool = True) -> List[Container]:
-        if only_running:
-            container_filter = self.api.api_pb2.ContainerFilter(
-                state=self.api.api_pb2.ContainerStateValue(state=self.api.api_pb2.CONTAINER_RUNNING)
-            )
-        else:
-            container_filter = None
+        request = self._list_running_request if only_running else self._list_all_request
 
-        containers = []
+        create_container = self._create_container
         with self.stub() as stub:
-            for runtime_container in stub.ListContainers(
-                self.api.api_pb2.ListContainersRequest(filter=container_filter)
-            ).containers:
-                if all_info:
-                    container = self._get_container(stub, runtime_container.id, verbose=True)
-                    if container is not None:
-                        containers.append(container)
-                else:
-                    containers.append(self._create_container(runtime_container, None))
+            runtime_containers = stub.ListContainers(request).containers
+            if not all_info:
+                return [create_container(runtime_container, None) for runtime_container in runtime_containers]
+
+            # the status RPCs are independent, so issue them concurrently (in bounded batches, to avoid flooding
+            # the runtime) rather than waiting for each one in turn.
+            container_status_future = stub.ContainerStatus.future
+            container_status_request = self.api.api_pb2.ContainerStatusRequest
+            containers = []
+            for i in range(0, len(runtime_containers), CONTAINER_STATUS_BATCH_SIZE):
+                status_futures = [
+                    container_status_future(container_status_request(container_id=runtime_container.id, verbose=True))
+                    for runtime_container in runtime_containers[i : i + CONTAINER_STATUS_BATCH_SIZE]
+                ]
+                for status_future in status_futures:
+                    try:
+                        status_response = status_future.result()
+                    except grpc.RpcError as e:
+                        if e.code() == grpc.StatusCode.NOT_FOUND:
+                            continue
+                        raise
+                    containers.append(self._create_container_from_status(status_response))
         return containers
 
     def _get_container(self, stub, container_id: str, *, verbose: bool) -> Optional[Container]:
@@ -90,13 +117,16 @@ class _Client:
             status_response = stub.ContainerStatus(
                 self.api.api_pb2.ContainerStatusRequest(container_id=container_id, verbose=verbose)
             )
-        except grpc._channel._InactiveRpcError as e:
+        except grpc.RpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
                 return None
             raise
         else:
-            pid: Optional[int] = json.loads(status_response.info.get("info", "{}")).get("pid")
-            return self._create_container(status_response.status, pid)
+            return self._create_container_from_status(status_response)
+
+    def _create_container_from_status(self, status_response) -> Container:
+        pid: Optional[int] = json.loads(status_response.info.get("info", "{}")).get("pid")
+        return self._create_container(status_response.status, pid)
 
     def get_container(self, container_id: str, all_info: bool) -> Optional[Container]:
         with self.stub() as stub:
@@ -107,8 +137,9 @@ class _Client:
         container,
         pid: Optional[int],
     ) -> Container:
+        api_pb2 = self.api.api_pb2
         time_info: Optional[TimeInfo] = None
-        if isinstance(container, self.api.api_pb2.ContainerStatus):
+        if isinstance(container, api_pb2.ContainerStatus):
             created_at_ns = assert_cast(int, container.created_at)
             started_at_ns = assert_cast(int, container.started_at)
             create_time = datetime.fromtimestamp(created_at_ns / 1e9, tz=timezone.utc)
@@ -128,7 +159,7 @@ class _Client:
             name=self._reconstruct_name(container),
             id=container.id,
             labels=container.labels,
-            running=container.state == self.api.api_pb2.CONTAINER_RUNNING,
+            running=container.state == api_pb2.CONTAINER_RUNNING,
             process=process,
             time_info=time_info,
             annotations=container.annotations,
@@ -154,7 +185,11 @@ def _try_cri_client(path: str, client: Type[T]) -> Optional[T]:
 
 
 def _get_client(path: str) -> V1Client | V1Alpha2Client | None:
-    path = "unix://" + ns.resolve_host_root_links(path)
+    host_path = ns.resolve_host_root_links(path)
+    # most nodes run a single runtime - don't pay for channel setup and failing RPCs on sockets that don't exist.
+    if not os.path.exists(host_path):
+        return None
+    path = "unix://" + host_path
     return _try_cri_client(path, V1Client) or _try_cri_client(path, V1Alpha2Client)
 
 
@@ -170,9 +205,16 @@ class CriClient(ContainersClientInterface):
             raise CriNotAvailableError(f"CRI is not available at any of {RUNTIMES}")
 
     def list_containers(self, all_info: bool, only_running: bool = True) -> List[Container]:
+        if len(self._clients) == 1:
+            return self._clients[0].list_containers(all_info, only_running=only_running)
+
+        # query all runtimes concurrently - gRPC releases the GIL while waiting on the socket.
         containers: List[Container] = []
-        for client in self._clients:
-            containers += client.list_containers(all_info, only_running=only_running)
+        with ThreadPoolExecutor(max_workers=len(self._clients)) as pool:
+            for client_containers in pool.map(
+                lambda client: client.list_containers(all_info, only_running=only_running), self._clients
+            ):
+                containers += client_containers
         return containers
 
     def get_container(self, container_id: str, all_info: bool) -> Container:
@@ -185,6 +227,10 @@ class CriClient(ContainersClientInterface):
     def get_runtimes(self) -> List[str]:
         return [client.runtime_name for client in self._clients]
 
+    def close(self) -> None:
+        for client in self._clients:
+            client.close()
+
 
 @dataclass
 class K8sContainer(Container):
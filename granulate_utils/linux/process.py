@@ -162,12 +162,41 @@ def is_kernel_thread(process: psutil.Process) -> bool:
 
 
 def search_for_process(filter: Callable[[psutil.Process], bool]) -> Iterator[psutil.Process]:
-    for proc in psutil.process_iter():
+    # prefetching the status lets us drop zombies without the extra status() read of is_process_running().
+    # is_running() is still required: process_iter() yields its cached Process objects without checking for PID
+    # reuse, so a cached entry may describe a dead process whose PID now belongs to another one.
+    for proc in psutil.process_iter(["status"]):
+        if proc.info["status"] == psutil.STATUS_ZOMBIE:
+            continue
         with contextlib.suppress(NoSuchProcess, AccessDenied):
-            if is_process_running(proc) and filter(proc):
+            if proc.is_running() and filter(proc):
                 yield proc
 
 
+def search_for_process_by_cmdline(*cmdline_parts: bytes) -> Iterator[psutil.Process]:
+    """
+    Finds processes whose raw /proc/<pid>/cmdline contains any of "cmdline_parts".
+    Unlike search_for_process, non-matching PIDs cost a single read - psutil.Process objects are only created
+    for the matches.
+    This is public API for downstream discovery code (e.g, locating a cluster manager by its main class);
+    nothing in this package calls it.
+    """
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:  # the process is gone, or we are not allowed to look at it
+                continue
+            if any(part in cmdline for part in cmdline_parts):
+                with contextlib.suppress(NoSuchProcess, AccessDenied):
+                    proc = psutil.Process(int(entry.name))
+                    if is_process_running(proc):
+                        yield proc
+
+
 class ProcCgroupLine:
     """
     The format of the line:  hierarchy-ID:controller-list:relative-path
@@ -14,44 +14,106 @@
 # limitations under the License.
 #
 
+import os
 import re
 from collections import namedtuple
-from typing import Optional
+from typing import Callable, Optional
 
 from granulate_utils.linux import COMM_PATTERN
 
+
 # see show_signal() for x86, e.g:
 # "a[613450]: segfault at 0 ip 000056087e9aa136 sp 00007fffab66a9f0 error 6 in a[56087e9aa000+1000]"
-SHOW_SIGNAL_X86 = re.compile(
-    rf"(?:<\d>)?(?:\[(?P<timestamp>\d+\.\d+)\] )?(?:traps: )?(?P<comm>{COMM_PATTERN})\[(?P<pid>\d+)\]:?"
-    r" (?P<desc>.*) ip(?::| )(?P<ip>[0-9a-f]+) sp(?::| )(?P<sp>[0-9a-f]+) error(?::| )"
-    r"(?P<error>[0-9a-f]+)(?: in (?P<vma_info>.+\[[0-9a-f]+\+[0-9a-f]+\]))?"
-)
+def _show_signal_x86_pattern(prefix: str = "") -> str:
+    return (
+        rf"(?:<\d>)?(?:\[(?P<{prefix}timestamp>\d+\.\d+)\] )?(?:traps: )?(?P<{prefix}comm>{COMM_PATTERN})"
+        rf"\[(?P<{prefix}pid>\d+)\]:? (?P<{prefix}desc>.*) ip(?::| )(?P<{prefix}ip>[0-9a-f]+) sp(?::| )"
+        rf"(?P<{prefix}sp>[0-9a-f]+) error(?::| )(?P<{prefix}error>[0-9a-f]+)"
+        rf"(?: in (?P<{prefix}vma_info>.+\[[0-9a-f]+\+[0-9a-f]+\]))?"
+    )
+
+
 # and arm64_show_signal() for Aarch64, e.g:
 # "a[160760]: unhandled exception: DABT (lower EL), ESR 0x92000044, level 0 translation fault in a[aaaab0b60000+1000]"
-SHOW_SIGNAL_AARCH64 = re.compile(
-    rf"(?:<\d>)?(?:\[(?P<timestamp>\d+\.\d+)\] )?(?P<comm>{COMM_PATTERN})\[(?P<pid>\d+)\]:"
-    r" unhandled exception: (?:(?P<desc>.*) )?in (?P<vma_info>.+\[[0-9a-f]+\+[0-9a-f]+\])"
-)
+def _show_signal_aarch64_pattern(prefix: str = "") -> str:
+    return (
+        rf"(?:<\d>)?(?:\[(?P<{prefix}timestamp>\d+\.\d+)\] )?(?P<{prefix}comm>{COMM_PATTERN})"
+        rf"\[(?P<{prefix}pid>\d+)\]: unhandled exception: (?:(?P<{prefix}desc>.*) )?"
+        rf"in (?P<{prefix}vma_info>.+\[[0-9a-f]+\+[0-9a-f]+\])"
+    )
+
+
+SHOW_SIGNAL_X86 = re.compile(_show_signal_x86_pattern())
+SHOW_SIGNAL_AARCH64 = re.compile(_show_signal_aarch64_pattern())
+# Both formats fused into one alternation, so each line is scanned once. Group names can't repeat across branches,
+# hence the per-architecture prefixes.
+_SHOW_SIGNAL = re.compile(f"{_show_signal_x86_pattern('x86_')}|{_show_signal_aarch64_pattern('aarch64_')}")
 
 SignalEntry = namedtuple("SignalEntry", "timestamp pid comm desc error_code vma_info")
 
 
-def get_signal_entry(dmesg_line: str) -> Optional[SignalEntry]:
+def _may_be_signal_line(dmesg_line: str) -> bool:
+    # Both formats contain "comm[pid]", bail out before running the regex on lines that can't possibly match.
+    return "[" in dmesg_line and "]" in dmesg_line
+
+
+def _x86_signal_entry(m: re.Match, prefix: str = "") -> SignalEntry:
+    ts, pid, comm, desc, error, vma_info = m.group(
+        *(prefix + name for name in ("timestamp", "pid", "comm", "desc", "error", "vma_info"))
+    )
+    return SignalEntry(float(ts) if ts is not None else None, int(pid), comm, desc, error, vma_info)
+
+
+def _aarch64_signal_entry(m: re.Match, prefix: str = "") -> SignalEntry:
+    ts, pid, comm, desc, vma_info = m.group(
+        *(prefix + name for name in ("timestamp", "pid", "comm", "desc", "vma_info"))
+    )
+    return SignalEntry(float(ts) if ts is not None else None, int(pid), comm, desc, None, vma_info)
+
+
+def get_signal_entry_x86(dmesg_line: str) -> Optional[SignalEntry]:
+    if not _may_be_signal_line(dmesg_line):
+        return None
     m = SHOW_SIGNAL_X86.search(dmesg_line)
+    return _x86_signal_entry(m) if m is not None else None
+
+
+def get_signal_entry_aarch64(dmesg_line: str) -> Optional[SignalEntry]:
+    if not _may_be_signal_line(dmesg_line):
+        return None
+    m = SHOW_SIGNAL_AARCH64.search(dmesg_line)
+    return _aarch64_signal_entry(m) if m is not None else None
+
+
+def get_signal_entry_any(dmesg_line: str) -> Optional[SignalEntry]:
+    """
+    Parses lines of either architecture, for when the kernel that wrote them isn't the one we run on.
+    """
+    if not _may_be_signal_line(dmesg_line):
+        return None
+    m = _SHOW_SIGNAL.search(dmesg_line)
     if m is None:
-        m = SHOW_SIGNAL_AARCH64.search(dmesg_line)
-
-    if m is not None:
-        d = m.groupdict()
-        ts = d["timestamp"]
-        return SignalEntry(
-            float(ts) if ts is not None else None,
-            int(d["pid"]),
-            d["comm"],
-            d["desc"],
-            d.get("error"),
-            d["vma_info"],
-        )
-    else:
         return None
+    if m["x86_pid"] is not None:
+        return _x86_signal_entry(m, "x86_")
+    return _aarch64_signal_entry(m, "aarch64_")
+
+
+def _get_signal_entry_parser(machine: str) -> Callable[[str], Optional[SignalEntry]]:
+    """
+    Returns the parser for lines written by a kernel of the given "uname -m" architecture.
+    """
+    return {
+        "x86_64": get_signal_entry_x86,
+        "aarch64": get_signal_entry_aarch64,
+    }.get(machine, get_signal_entry_any)
+
+
+_NATIVE_GET_SIGNAL_ENTRY = _get_signal_entry_parser(os.uname().machine)
+
+
+def get_signal_entry(dmesg_line: str) -> Optional[SignalEntry]:
+    """
+    Parses a signal line written by the running kernel, so only the format of the current architecture is checked.
+    """
+    return _NATIVE_GET_SIGNAL_ENTRY(dmesg_line)
@@ -0,0 +1,200 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import grpc  # type: ignore # no types-grpc sadly
+import pytest
+
+from granulate_utils.containers import cri
+from granulate_utils.containers.cri import CONTAINER_STATUS_BATCH_SIZE, CriClient, V1Client
+from granulate_utils.exceptions import CriNotAvailableError
+from granulate_utils.generated.containers.cri.v1 import api_pb2, api_pb2_grpc  # type: ignore
+
+
+class FakeRuntimeService(api_pb2_grpc.RuntimeServiceServicer):
+    def __init__(
+        self,
+        count: int,
+        status_errors: Optional[Dict[str, grpc.StatusCode]] = None,
+        runtime_name: str = "fake",
+        list_error: Optional[grpc.StatusCode] = None,
+    ) -> None:
+        self.runtime_name = runtime_name
+        self.container_ids = [f"{runtime_name}-container{i}" for i in range(count)]
+        self.status_errors = status_errors or {}
+        self.list_error = list_error
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _labels(container_id: str) -> Dict[str, str]:
+        return {
+            "io.kubernetes.container.name": container_id,
+            "io.kubernetes.pod.name": "pod",
+            "io.kubernetes.pod.namespace": "default",
+            "io.kubernetes.pod.uid": "uid",
+        }
+
+    def Version(self, request, context):
+        return api_pb2.VersionResponse(runtime_name=self.runtime_name)
+
+    def ListContainers(self, request, context):
+        if self.list_error is not None:
+            context.abort(self.list_error, self.runtime_name)
+        return api_pb2.ListContainersResponse(
+            containers=[
+                api_pb2.Container(
+                    id=container_id,
+                    labels=self._labels(container_id),
+                    annotations={"io.kubernetes.container.restartCount": "0"},
+                    state=api_pb2.CONTAINER_RUNNING,
+                )
+                for container_id in self.container_ids
+            ]
+        )
+
+    def ContainerStatus(self, request, context):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)  # let concurrent requests overlap
+        with self._lock:
+            self.in_flight -= 1
+
+        if (code := self.status_errors.get(request.container_id)) is not None:
+            context.abort(code, request.container_id)
+        return api_pb2.ContainerStatusResponse(
+            status=api_pb2.ContainerStatus(
+                id=request.container_id,
+                labels=self._labels(request.container_id),
+                annotations={"io.kubernetes.container.restartCount": "0"},
+                state=api_pb2.CONTAINER_RUNNING,
+                created_at=1_700_000_000_000_000_000,
+            ),
+            info={"info": json.dumps({"pid": 0})},
+        )
+
+
+@contextmanager
+def fake_runtime(service: FakeRuntimeService) -> Iterator[str]:
+    # unix socket paths are limited to ~108 chars, so keep them short rather than under tmp_path
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cri.sock")
+        server = grpc.server(ThreadPoolExecutor(max_workers=2 * CONTAINER_STATUS_BATCH_SIZE))
+        api_pb2_grpc.add_RuntimeServiceServicer_to_server(service, server)
+        server.add_insecure_port("unix://" + path)
+        server.start()
+        try:
+            yield path
+        finally:
+            server.stop(None)
+
+
+def test_list_containers_all_info() -> None:
+    # more than two batches, with a vanished container in the middle one
+    service = FakeRuntimeService(70, status_errors={"fake-container40": grpc.StatusCode.NOT_FOUND})
+    with fake_runtime(service) as path:
+        client = V1Client("unix://" + path)
+        try:
+            containers = client.list_containers(all_info=True)
+        finally:
+            client.close()
+
+    assert [c.id for c in containers] == [c for c in service.container_ids if c != "fake-container40"]
+    assert all(c.time_info is not None for c in containers)
+    assert 1 < service.max_in_flight <= CONTAINER_STATUS_BATCH_SIZE
+
+
+def test_list_containers_all_info_error() -> None:
+    service = FakeRuntimeService(70, status_errors={"fake-container40": grpc.StatusCode.INTERNAL})
+    with fake_runtime(service) as path:
+        client = V1Client("unix://" + path)
+        try:
+            with pytest.raises(grpc.RpcError) as excinfo:
+                client.list_containers(all_info=True)
+        finally:
+            client.close()
+
+    assert excinfo.value.code() == grpc.StatusCode.INTERNAL
+
+
+def test_get_container() -> None:
+    service = FakeRuntimeService(2, status_errors={"fake-container1": grpc.StatusCode.NOT_FOUND})
+    with fake_runtime(service) as path:
+        client = V1Client("unix://" + path)
+        try:
+            container = client.get_container("fake-container0", all_info=True)
+            assert container is not None and container.id == "fake-container0"
+            assert client.get_container("fake-container1", all_info=True) is None
+        finally:
+            client.close()
+
+
+@contextmanager
+def fake_cri_client(monkeypatch: pytest.MonkeyPatch, services: List[FakeRuntimeService]) -> Iterator[CriClient]:
+    with fake_runtime(services[0]) as path0, fake_runtime(services[1]) as path1:
+        monkeypatch.setattr(cri, "RUNTIMES", [path0, path1])
+        # the sockets live in our own mount namespace
+        monkeypatch.setattr(cri.ns, "resolve_host_root_links", lambda path: path)
+        client = CriClient()
+        try:
+            yield client
+        finally:
+            client.close()
+
+
+@pytest.mark.parametrize("all_info", [True, False])
+def test_cri_client_multiple_runtimes(monkeypatch: pytest.MonkeyPatch, all_info: bool) -> None:
+    services = [FakeRuntimeService(40, runtime_name="containerd"), FakeRuntimeService(3, runtime_name="cri-o")]
+    with fake_cri_client(monkeypatch, services) as client:
+        assert client.get_runtimes() == ["containerd", "cri-o"]
+        containers = client.list_containers(all_info)
+
+    assert [c.id for c in containers] == services[0].container_ids + services[1].container_ids
+    assert [c.runtime for c in containers] == ["containerd"] * 40 + ["cri-o"] * 3
+
+
+def test_cri_client_multiple_runtimes_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    services = [
+        FakeRuntimeService(3, runtime_name="containerd"),
+        FakeRuntimeService(3, runtime_name="cri-o", list_error=grpc.StatusCode.UNAVAILABLE),
+    ]
+    with fake_cri_client(monkeypatch, services) as client:
+        with pytest.raises(grpc.RpcError) as excinfo:
+            client.list_containers(all_info=False)
+
+    assert excinfo.value.code() == grpc.StatusCode.UNAVAILABLE
+
+
+def test_cri_client_skips_missing_sockets(monkeypatch: pytest.MonkeyPatch) -> None:
+    tried_paths: List[str] = []
+    try_cri_client = cri._try_cri_client
+
+    def _try_cri_client(path, client):
+        tried_paths.append(path)
+        return try_cri_client(path, client)
+
+    monkeypatch.setattr(cri, "_try_cri_client", _try_cri_client)
+    monkeypatch.setattr(cri.ns, "resolve_host_root_links", lambda path: path)
+
+    with tempfile.TemporaryDirectory() as tmpdir, fake_runtime(FakeRuntimeService(3, runtime_name="cri-o")) as path:
+        missing_path = os.path.join(tmpdir, "missing.sock")
+        monkeypatch.setattr(cri, "RUNTIMES", [missing_path, path])
+        client = CriClient()
+        try:
+            assert len(client._clients) == 1
+            assert client.get_runtimes() == ["cri-o"]
+        finally:
+            client.close()
+        # no connection was attempted on the missing socket
+        assert tried_paths == ["unix://" + path]
+
+        monkeypatch.setattr(cri, "RUNTIMES", [missing_path, os.path.join(tmpdir, "also-missing.sock")])
+        with pytest.raises(CriNotAvailableError):
+            CriClient()
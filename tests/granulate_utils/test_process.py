@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+import psutil
+
+from granulate_utils.linux.process import search_for_process, search_for_process_by_cmdline
+
+
+def test_search_for_process_by_cmdline() -> None:
+    marker = f"search-marker-{uuid.uuid4()}"
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)", marker])
+    try:
+        # the interpreter may take a moment to exec
+        for _ in range(100):
+            found = [p.pid for p in search_for_process_by_cmdline(marker.encode())]
+            if found:
+                break
+            time.sleep(0.05)
+        assert found == [proc.pid]
+        assert [p.pid for p in search_for_process_by_cmdline(b"no-such-part", marker.encode())] == [proc.pid]
+        assert list(search_for_process_by_cmdline(f"{marker}-nope".encode())) == []
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_search_for_process_by_cmdline_single_part() -> None:
+    # a single bytes part is matched as a whole, not byte-by-byte (which would match nearly every process)
+    part = f"search-marker-{uuid.uuid4()}".encode()
+    assert list(search_for_process_by_cmdline(part)) == []
+
+
+def test_search_for_process_skips_zombies() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    # not wait()-ed, so it stays a zombie once it exits
+    for _ in range(100):
+        if psutil.Process(proc.pid).status() == psutil.STATUS_ZOMBIE:
+            break
+        time.sleep(0.05)
+    try:
+        assert psutil.Process(proc.pid).status() == psutil.STATUS_ZOMBIE
+        assert list(search_for_process(lambda p: p.pid == proc.pid)) == []
+        assert [p.pid for p in search_for_process(lambda p: p.pid == os.getpid())] == [os.getpid()]
+    finally:
+        proc.wait()
+
+
+def test_search_for_process_skips_reused_pid() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        # warm process_iter()'s cache, then make the cached entry look like an older process that had the same PID
+        list(psutil.process_iter())
+        stale = psutil._pmap[proc.pid]  # type: ignore[attr-defined]
+        stale._create_time -= 1000
+        stale._ident = (proc.pid, stale._create_time)
+
+        assert stale != psutil.Process(proc.pid)  # compares identities without touching the cache
+        assert list(search_for_process(lambda p: p.pid == proc.pid)) == []
+    finally:
+        proc.kill()
+        proc.wait()
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from granulate_utils.linux import signals
+from granulate_utils.linux.signals import (
+    SignalEntry,
+    get_signal_entry,
+    get_signal_entry_aarch64,
+    get_signal_entry_any,
+    get_signal_entry_x86,
+)
+
+X86_LINE = (
+    "[12345.678901] a[613450]: segfault at 0 ip 000056087e9aa136 sp 00007fffab66a9f0 error 6 in a[56087e9aa000+1000]"
+)
+X86_ENTRY = SignalEntry(12345.678901, 613450, "a", "segfault at 0", "6", "a[56087e9aa000+1000]")
+AARCH64_LINE = (
+    "[100.5] a[160760]: unhandled exception: DABT (lower EL), ESR 0x92000044, level 0 translation fault"
+    " in a[aaaab0b60000+1000]"
+)
+AARCH64_ENTRY = SignalEntry(
+    100.5, 160760, "a", "DABT (lower EL), ESR 0x92000044, level 0 translation fault", None, "a[aaaab0b60000+1000]"
+)
+
+
+@pytest.mark.parametrize("parse", [get_signal_entry_x86, get_signal_entry_any])
+def test_x86_signal_entry(parse) -> None:
+    assert parse(X86_LINE) == X86_ENTRY
+
+
+@pytest.mark.parametrize("parse", [get_signal_entry_x86, get_signal_entry_any])
+def test_x86_traps_signal_entry(parse) -> None:
+    line = (
+        "traps: java[1234] general protection fault ip:7f0c1d2e3f40 sp:7ffd5e6f7a80 error:0"
+        " in libc.so[7f0c1d000000+1b0000]"
+    )
+    assert parse(line) == SignalEntry(
+        None, 1234, "java", "general protection fault", "0", "libc.so[7f0c1d000000+1b0000]"
+    )
+
+
+@pytest.mark.parametrize("parse", [get_signal_entry_aarch64, get_signal_entry_any])
+def test_aarch64_signal_entry(parse) -> None:
+    assert parse(AARCH64_LINE) == AARCH64_ENTRY
+
+
+@pytest.mark.parametrize(
+    "parse", [get_signal_entry, get_signal_entry_x86, get_signal_entry_aarch64, get_signal_entry_any]
+)
+def test_non_signal_lines(parse) -> None:
+    assert parse("eth0: link becomes ready") is None
+    assert parse("[   12.345678] EXT4-fs (sda1): mounted filesystem with ordered data mode") is None
+
+
+def test_architectures_dont_overlap() -> None:
+    x86_line = "a[1]: segfault at 0 ip 0000000000000001 sp 0000000000000002 error 4 in a[1000+1000]"
+    aarch64_line = "a[1]: unhandled exception: DABT (lower EL) in a[1000+1000]"
+    assert get_signal_entry_x86(aarch64_line) is None
+    assert get_signal_entry_aarch64(x86_line) is None
+
+
+def test_get_signal_entry_native() -> None:
+    machine = os.uname().machine
+    if machine == "x86_64":
+        assert get_signal_entry(X86_LINE) == X86_ENTRY
+    elif machine == "aarch64":
+        assert get_signal_entry(AARCH64_LINE) == AARCH64_ENTRY
+    else:
+        pytest.skip(f"no native signal format for {machine}")
+
+
+def test_get_signal_entry_parser_dispatch() -> None:
+    assert signals._get_signal_entry_parser("x86_64") is get_signal_entry_x86
+    assert signals._get_signal_entry_parser("aarch64") is get_signal_entry_aarch64
+
+
+def test_get_signal_entry_unknown_machine(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(signals, "_NATIVE_GET_SIGNAL_ENTRY", signals._get_signal_entry_parser("riscv64"))
+    assert get_signal_entry(X86_LINE) == X86_ENTRY
+    assert get_signal_entry(AARCH64_LINE) == AARCH64_ENTRY